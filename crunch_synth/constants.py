@@ -2,6 +2,9 @@
 Constants used across the Crunch-Synth game package.
 """
 
+# Number of seconds in a day (timestamps are UNIX seconds, UTC: no DST shifts)
+SECONDS_PER_DAY = 86400
+
 # Supported assets
 SUPPORTED_ASSETS = [
     "BTC",      # BTC/USD
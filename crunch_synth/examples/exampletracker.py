@@ -1,8 +1,42 @@
 from datetime import datetime, timezone, timedelta
+from math import sqrt
 import numpy as np
 from tqdm.auto import tqdm
 
 from crunch_synth import TrackerBase, TrackerEvaluator
+from crunch_synth.utils.distributions import round_significant
+
+
+def _return_stats_loop(prices: np.ndarray) -> tuple[float, float]:
+    """
+    Mean and (population) std of the incremental returns `prices[i] - prices[i-1]`.
+
+    The mean of consecutive differences telescopes to `(prices[-1] - prices[0]) / n`,
+    so a single pass over the prices is enough for the centered sum of squares.
+    """
+    n = len(prices) - 1
+    mean = (prices[n] - prices[0]) / n
+    m2 = 0.0
+    for i in range(1, n + 1):
+        d = prices[i] - prices[i - 1] - mean
+        m2 += d * d
+    return mean, sqrt(m2 / n)
+
+
+def _return_stats_numpy(prices: np.ndarray) -> tuple[float, float]:
+    """Same as `_return_stats_loop`, vectorized with numpy (used when numba is not installed)."""
+    returns = prices[1:] - prices[:-1]
+    mean = (prices[-1] - prices[0]) / len(returns)
+    returns -= mean
+    return float(mean), float(np.sqrt(np.dot(returns, returns) / len(returns)))
+
+
+try:
+    # Optional: compile the loop with numba (avoids numpy dispatch overhead on small arrays)
+    from numba import njit
+    _return_stats = njit(cache=True, fastmath=True)(_return_stats_loop)
+except ImportError:
+    _return_stats = _return_stats_numpy
 
 
 class GaussianStepTracker(TrackerBase):
@@ -24,6 +58,9 @@ class GaussianStepTracker(TrackerBase):
     """
     def __init__(self):
         super().__init__()
+        # Return statistics per asset, reused until the asset prices are updated:
+        # {asset -> (prices version, mu, sigma)}
+        self._stats_cache = {}
 
     def predict(self, asset: str, horizon: int, step: int):
         """
@@ -36,26 +73,35 @@ class GaussianStepTracker(TrackerBase):
 
         # Retrieve recent historical prices (up to 30 days) sampled at 5-minute resolution
         resolution = 5 * 60 # Use a multiple of 60s because the original data has 60s resolution
-        price_points = self.prices.get_prices(asset, days=3, resolution=resolution)
-        if not price_points:
-            return []
 
-        past_times, past_prices = zip(*price_points)
+        # predict() is called once per step on the same price history:
+        # the statistics only need to be recomputed when the prices were updated
+        # (new ticks, but also backfilled or corrected older prices).
+        version = self.prices.get_version(asset)
+        cached = self._stats_cache.get(asset)
+        if cached is not None and cached[0] == version:
+            _, mu, sigma = cached
+        else:
+            price_points = self.prices.get_prices(asset, days=3, resolution=resolution)
+            if not price_points:
+                return []
 
-        # Latest observed price (Use it to handle time-dependent logic (e.g. market hours, weekends))
-        current_price = past_prices[-1]
-        current_time = datetime.fromtimestamp(past_times[-1], tz=timezone.utc)
+            _, past_prices = zip(*price_points)
 
-        # Compute historical incremental returns (price differences)
-        returns = np.diff(past_prices)
+            if len(past_prices) < 3:
+                return []
 
-        # Estimate drift (mean return) and volatility (std dev of returns)
-        mu = float(np.mean(returns))
-        sigma = float(np.std(returns))
+            # Estimate drift (mean return) and volatility (std dev of returns)
+            # from historical incremental returns (price differences)
+            mu, sigma = _return_stats(np.asarray(past_prices, dtype=np.float64))
+            self._stats_cache[asset] = (version, mu, sigma)
 
         if sigma <= 0:
             return []
 
+        # Latest observed price: use `self.prices.get_last_price(asset)` to handle
+        # time-dependent logic (e.g. market hours, weekends)
+
         num_segments = horizon // step
 
         # Construct one predictive distribution per future time step.
@@ -69,24 +115,27 @@ class GaussianStepTracker(TrackerBase):
         #   r_{t,k} ~ N( (step / 300) · μ , sqrt(step / 300) · σ )
         #
         # where μ and σ are estimated from historical 5-minute returns.
-        distributions = []
-        for k in range(1, num_segments + 1):
-            distributions.append({
-                "step": k * step,                      # Time offset (in seconds) from forecast origin
-                "type": "mixture",
-                "components": [{
-                    "density": {
-                        "type": "builtin",             # Note: use 'builtin' distributions instead of 'scipy' for speed
-                        "name": "norm",  
-                        "params": {
-                            "loc": (step/resolution) * mu, 
-                            "scale": np.sqrt(step/resolution) * sigma
-                            }
-                    },
-                    "weight": 1                        # Mixture weight — multiple densities with different weights can be combined
+        #
+        # The density is the same for every step, so it is built once and shared
+        # by all entries. Its params are already rounded to the 6 significant digits
+        # applied by `predict_all`, so that rounding pass leaves the shared dict unchanged.
+        density = {
+            "type": "builtin",                         # Note: use 'builtin' distributions instead of 'scipy' for speed
+            "name": "norm",
+            "params": {
+                "loc": round_significant((step/resolution) * mu, 6),
+                "scale": round_significant(np.sqrt(step/resolution) * sigma, 6)
+            }
+        }
+        distributions = [{
+            "step": k * step,                          # Time offset (in seconds) from forecast origin
+            "type": "mixture",
+            "components": [{
+                "density": density,
+                "weight": 1                            # Mixture weight — multiple densities with different weights can be combined
                                                        # total components capped for runtime safety to constants.MAX_DISTRIBUTION_COMPONENTS
-                }]
-            })
+            }]
+        } for k in range(1, num_segments + 1)]
 
         return distributions
 
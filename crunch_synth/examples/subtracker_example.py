@@ -32,6 +32,7 @@ import os
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.linear_model import LinearRegression
 
 from crunch_synth import TrackerBase, SubTracker, FORECAST_PROFILES, SUPPORTED_ASSETS
@@ -39,6 +40,29 @@ from crunch_synth import TrackerBase, SubTracker, FORECAST_PROFILES, SUPPORTED_A
 logger = logging.getLogger(__name__)
 
 
+def _training_samples(returns: np.ndarray, window: int, future: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build the training set of `MySubTracker`: one sample per i in [window, len(returns) - future),
+    with features (mean, std) of the past returns `returns[i - window:i]`
+    and target the log std of the future returns `returns[i:i + future]`.
+    """
+    n_samples = len(returns) - future - window
+    if n_samples <= 0:
+        raise ValueError("Not enough data to train")
+
+    # All rolling windows at once (strided views, no copy) reduced in a single call each
+    past = sliding_window_view(returns, window)[:n_samples]
+    future_returns = sliding_window_view(returns, future)[window:window + n_samples]
+
+    # simple features
+    X = np.column_stack([past.mean(axis=1), past.std(axis=1)])
+
+    # target = future volatility
+    y = np.log(future_returns.std(axis=1) + 1e-8)
+
+    return X, y
+
+
 class MySubTracker(SubTracker):
 
     def __init__(self):
@@ -111,35 +135,16 @@ class MySubTracker(SubTracker):
     def train_model(self, horizon, asset, histories):
         model = LinearRegression()
 
-        X = []
-        y = []
-
         prices = histories[asset]
         prices = np.array(prices)
 
-        returns = np.diff(prices)
+        # np.diff on the (timestamp, price) rows: one value per row
+        returns = np.diff(prices).ravel()
 
         window = self.config["window_size"]
         future = 5  # small future window for target
 
-        for i in range(window, len(returns) - future):
-            past = returns[i - window:i]
-
-            # simple features
-            feat_mean = np.mean(past)
-            feat_std = np.std(past)
-
-            X.append([feat_mean, feat_std])
-
-            # target = future volatility
-            future_returns = returns[i:i + future]
-            y.append(np.log(np.std(future_returns) + 1e-8))
-
-        if len(X) == 0:
-            raise ValueError("Not enough data to train")
-
-        X = np.array(X)
-        y = np.array(y)
+        X, y = _training_samples(returns, window, future)
 
         model.fit(X, y)
         return model
@@ -1,30 +1,189 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
-from collections import defaultdict
+import sys
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from typing import TypeAlias
 
-from sortedcontainers import SortedDict
+import numpy as np
+
+from crunch_synth.constants import SECONDS_PER_DAY
 
 PriceEntry: TypeAlias = tuple[int, float]
 Asset: TypeAlias = str
 PriceData: TypeAlias = dict[Asset, list[PriceEntry]]
 
+# Initial number of slots allocated per asset (grown geometrically on demand)
+_INITIAL_CAPACITY = 1024
+
+# Below this mean number of points per uniformly spaced run, get_prices resamples
+# with a vectorized successor chain rather than striding run by run
+_MIN_MEAN_RUN_LENGTH = 16
+
+
+@dataclass
+class _AssetBuffer:
+    """
+    Per-asset price columns kept sorted by timestamp, without duplicates.
+
+    `ts` (int64) and `price` (float64) are preallocated buffers: only the
+    slots in [head, tail) are valid. Dropping old entries just moves `head`
+    forward; the valid window is moved back to the start of the buffers
+    (or the capacity doubled) only when `tail` reaches the end, so both
+    appends and truncation are amortized O(1).
+    """
+    ts: np.ndarray = field(default_factory=lambda: np.empty(_INITIAL_CAPACITY, dtype=np.int64))
+    price: np.ndarray = field(default_factory=lambda: np.empty(_INITIAL_CAPACITY, dtype=np.float64))
+    head: int = 0
+    tail: int = 0
+    # Bumped on every update, used to invalidate cached query results
+    version: int = 0
+
+    def __len__(self) -> int:
+        return self.tail - self.head
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """View on the valid timestamps."""
+        return self.ts[self.head:self.tail]
+
+    @property
+    def prices(self) -> np.ndarray:
+        """View on the valid prices."""
+        return self.price[self.head:self.tail]
+
+    def reserve(self, size: int):
+        """Move the valid window back to the start of the buffers, with room for `size` entries."""
+        n = self.tail - self.head
+        capacity = len(self.ts)
+        # Keep at least a quarter of the buffers free after compaction, so that
+        # a steady sliding window does not compact on every append.
+        if 4 * size > 3 * capacity:
+            while 4 * size > 3 * capacity:
+                capacity *= 2
+            ts = np.empty(capacity, dtype=np.int64)
+            price = np.empty(capacity, dtype=np.float64)
+        else:
+            ts, price = self.ts, self.price
+        # (overlapping slices are copied as if through a temporary buffer)
+        ts[:n] = self.ts[self.head:self.tail]
+        price[:n] = self.price[self.head:self.tail]
+        self.ts, self.price = ts, price
+        self.head, self.tail = 0, n
+
+    def append(self, ts: np.ndarray, price: np.ndarray):
+        """Append entries that are all strictly newer than the last stored one."""
+        if self.tail + len(ts) > len(self.ts):
+            self.reserve(self.tail - self.head + len(ts))
+        end = self.tail + len(ts)
+        self.ts[self.tail:end] = ts
+        self.price[self.tail:end] = price
+        self.tail = end
+
+    def assign(self, ts: np.ndarray, price: np.ndarray):
+        """Replace the whole content with the given (sorted, unique) entries."""
+        self.head = self.tail = 0
+        self.append(ts, price)
+
+    def drop_before(self, cutoff: int):
+        """Remove all entries with a timestamp strictly lower than `cutoff`."""
+        self.head += int(np.searchsorted(self.timestamps, cutoff, side="left"))
+
+
+def _sorted_unique(ts: np.ndarray, price: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sort entries by timestamp and keep the last occurrence of duplicated timestamps."""
+    if len(ts) > 1 and np.any(ts[1:] <= ts[:-1]):
+        order = np.argsort(ts, kind="stable")
+        ts, price = ts[order], price[order]
+        # last occurrence wins: keep i if ts[i] != ts[i + 1]
+        keep = np.append(ts[1:] != ts[:-1], True)
+        ts, price = ts[keep], price[keep]
+    return ts, price
+
+
+def _resample(ts: np.ndarray, prices: np.ndarray, resolution: int) -> list[PriceEntry]:
+    """Keep the first point, then each first point at least `resolution` seconds after the previously kept one."""
+    n = len(ts)
+    if n < 2:
+        return list(zip(ts.tolist(), prices.tolist()))
+    # Timestamps are unique integers: any resolution below 1s keeps every point
+    resolution = max(resolution, 1)
+
+    # Runs of uniformly spaced points (the usual 60s granularity, broken by missing bars)
+    diffs = np.diff(ts)
+    spacing = int(diffs.min())
+    breaks = diffs != spacing
+
+    if (np.count_nonzero(breaks) + 1) * _MIN_MEAN_RUN_LENGTH > n:
+        # Irregular data (short runs): for every point, index of the first point at least
+        # `resolution` seconds later, then follow that chain from the first point.
+        next_idx = np.searchsorted(ts, ts + resolution, side="left").tolist()
+
+        # Selected points are at least `resolution` seconds apart: bound the output size
+        idx = [0] * (int((ts[-1] - ts[0]) // resolution) + 1)
+        i = j = 0
+        while i < n:
+            idx[j] = i
+            j += 1
+            i = next_idx[i]
+        idx = np.array(idx[:j])
+        return list(zip(ts[idx].tolist(), prices[idx].tolist()))
+
+    # Index of the last point of each run
+    run_ends = np.flatnonzero(breaks).tolist()
+    run_ends.append(n - 1)
+
+    # Within a run, the resampled points are simply every `stride`-th point.
+    # Past the end of a run, jump to the first point at least `resolution` seconds
+    # after the last selected one ("next tick >= target" resampling).
+    stride = -(-resolution // spacing)
+    chunks = []
+    i = 0
+    r = 0
+    while i < n:
+        r = bisect_left(run_ends, i, r)
+        end = run_ends[r]
+        last = i + (end - i) // stride * stride
+        chunks.append(np.arange(i, last + 1, stride))
+        i = int(np.searchsorted(ts, ts[last] + resolution, side="left"))
+
+    idx = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+    return list(zip(ts[idx].tolist(), prices[idx].tolist()))
+
 
 class PriceStore:
     """
     PriceStore caches prices for multiple assets and allows fast updates / queries.
-    Uses sortedcontainers.SortedDict: timestamp -> price (kept sorted, updates overwrite).
+    Prices are stored per asset as sorted NumPy columns (timestamps, prices), updates overwrite.
     """
 
     def __init__(self, window_days: int = 30):
-        # per asset: SortedDict[int, float]
-        self.data: dict[Asset, SortedDict[int, float]] = defaultdict(SortedDict)
+        # per asset: sorted int64 timestamps / float64 prices
+        # (plain dict: looking up an unknown asset never creates an entry)
+        self.data: dict[Asset, _AssetBuffer] = {}
         # Maximum number of days of historical data to keep per asset.
         self.window_days = window_days
 
         self.last_timestamp: int | None = None
 
+        # Single-entry cache of the last looked-up asset (consecutive calls
+        # usually target the same asset). Buffers are updated in place, so the
+        # cached reference stays valid.
+        self._last_asset: Asset | None = None
+        self._last_series: _AssetBuffer | None = None
+
+        # get_prices results: (asset, days, resolution) -> (buffer version, result)
+        self._get_prices_cache: dict[tuple[Asset, int | None, int], tuple[int, list[PriceEntry]]] = {}
+
+    def _series(self, asset: Asset) -> _AssetBuffer | None:
+        """Return the buffer of `asset` (None if unknown), going through the last-asset cache."""
+        if asset is self._last_asset:
+            return self._last_series
+        series = self.data.get(asset)
+        self._last_asset = asset
+        self._last_series = series
+        return series
+
     def add_price(self, symbol: Asset, price: float, timestamp: int):
         """Add a single (timestamp, price) entry for an asset."""
         self.add_prices(symbol, [(timestamp, price)])
@@ -34,28 +193,68 @@ class PriceStore:
         if not entries:
             return
 
-        series = self.data[symbol]
+        if len(entries) == 1:
+            # Live ticks usually carry a single pair: skip the unzip
+            (t, p), = entries
+            ts_new = np.array((t,), dtype=np.int64)
+            price_new = np.array((p,), dtype=np.float64)
+        else:
+            ts_new, price_new = zip(*entries)
+            ts_new = np.fromiter(ts_new, dtype=np.int64, count=len(entries))
+            price_new = np.fromiter(price_new, dtype=np.float64, count=len(entries))
+
+        self.add_prices_arrays(symbol, ts_new, price_new)
+
+    def add_prices_arrays(self, symbol: Asset, ts: np.ndarray, prices: np.ndarray):
+        """
+        Add prices for a single asset from parallel arrays of timestamps and prices (insert/update).
+        Same as `add_prices` without the conversion from (timestamp, price) pairs.
+        """
+        if len(ts) == 0:
+            return
+
+        # Interned symbols make the last-asset cache hit on identity
+        # (sys.intern rejects str subclasses such as numpy.str_: keep those as is)
+        if type(symbol) is str:
+            symbol = sys.intern(symbol)
+        series = self._series(symbol)
+        if series is None:
+            series = self.data[symbol] = _AssetBuffer()
+            self._last_series = series
+
+        ts_new = np.asarray(ts, dtype=np.int64)
+        price_new = np.asarray(prices, dtype=np.float64)
 
-        # Update/insert (if same ts exists, it's overwritten)
-        # (If entries may contain duplicates, last one wins naturally.)
-        for t, p in entries:
-            series[t] = p
+        # If entries contain duplicates, last one wins.
+        ts_new, price_new = _sorted_unique(ts_new, price_new)
+
+        if not series or ts_new[0] > series.ts[series.tail - 1]:
+            # Fast path: all entries are newer than the stored ones
+            series.append(ts_new, price_new)
+        else:
+            # Entries up to `split` overlap the stored range, the rest are newer
+            stored = series.timestamps
+            split = int(np.searchsorted(ts_new, stored[-1], side="right"))
+            pos = np.searchsorted(stored, ts_new[:split], side="left")
+
+            if np.array_equal(stored[pos], ts_new[:split]):
+                # Overlapping timestamps already exist: overwrite them in place, append the newer ones
+                series.prices[pos] = price_new[:split]
+                series.append(ts_new[split:], price_new[split:])
+            else:
+                # Merge with the stored entries (if same ts exists, it's overwritten)
+                ts_all = np.concatenate((stored, ts_new))
+                price_all = np.concatenate((series.prices, price_new))
+                series.assign(*_sorted_unique(ts_all, price_all))
 
         # Update global last_timestamp
-        newest = series.peekitem(-1)[0]
+        newest = int(series.ts[series.tail - 1])
         if self.last_timestamp is None or newest > self.last_timestamp:
             self.last_timestamp = newest
 
         # Keep only last window_days relative to newest timestamp
-        if series:
-            last_ts = series.peekitem(-1)[0]
-            cutoff = int(
-                (datetime.fromtimestamp(last_ts, tz=timezone.utc) - timedelta(days=self.window_days)).timestamp()
-            )
-
-            i = series.bisect_left(cutoff)
-            if i:
-                del series.iloc[:i]
+        series.drop_before(int(newest - self.window_days * SECONDS_PER_DAY))
+        series.version += 1
 
     def add_bulk(self, data: PriceData):
         """
@@ -78,60 +277,87 @@ class PriceStore:
         resolution : int
             Minimum time difference between consecutive returned points in seconds.
         """
-        series = self.data.get(asset)
+        series = self._series(asset)
         if not series:
             return []
 
-        if days is not None:
-            last_ts = series.peekitem(-1)[0]
-            cutoff = int((datetime.fromtimestamp(last_ts, tz=timezone.utc) - timedelta(days=days)).timestamp())
-            it = series.irange(minimum=cutoff, inclusive=(True, True))
-        else:
-            it = iter(series.keys())
+        # Consecutive calls (e.g. one predict() per step) often request the same
+        # window with no new data in between: reuse the previous result.
+        key = (asset, days, resolution)
+        cached = self._get_prices_cache.get(key)
+        if cached is not None and cached[0] == series.version:
+            return list(cached[1])
 
-        result: list[PriceEntry] = []
-        target_next: int | None = None
+        ts = series.timestamps
+        prices = series.prices
 
-        for t in it:
-            if target_next is None:
-                result.append((t, series[t]))
-                target_next = t + resolution
-            elif t >= target_next:
-                result.append((t, series[t]))
-                target_next = t + resolution
+        if days is not None:
+            cutoff = int(ts[-1] - days * SECONDS_PER_DAY)
+            start = int(np.searchsorted(ts, cutoff, side="left"))
+            ts = ts[start:]
+            prices = prices[start:]
+
+        result = _resample(ts, prices, resolution)
+        self._get_prices_cache[key] = (series.version, result)
+        return list(result)
 
-        return result
+    def get_version(self, asset: str) -> int:
+        """
+        Retrieve the update counter of an asset, incremented on every update of its prices
+        (including overwrites of older entries). Returns 0 if no data is available.
+        Results derived from the prices stay valid as long as this value is unchanged.
+        """
+        series = self._series(asset)
+        if series is None:
+            return 0
+        return series.version
 
     def get_last_price(self, asset: str) -> PriceEntry | None:
         """Retrieve the last (timestamp, price) pair for a given asset."""
-        series = self.data.get(asset)
+        series = self._series(asset)
         if not series:
             return None
-        t, p = series.peekitem(-1)
-        return t, p
+        i = series.tail - 1
+        return int(series.ts[i]), float(series.price[i])
 
     def get_closest_price(self, asset: str, time: int) -> PriceEntry | None:
         """
         Retrieve the (timestamp, price) pair closest to the given timestamp for a specific asset.
         Returns None if no data is available.
         """
-        series = self.data.get(asset)
+        series = self._series(asset)
         if not series:
             return None
 
-        pos = series.bisect_left(time)
+        ts = series.timestamps
+        pos = int(np.searchsorted(ts, time, side="left"))
 
-        if pos == 0:
-            t, p = series.peekitem(0)
-            return t, p
-        if pos == len(series):
-            t, p = series.peekitem(-1)
-            return t, p
+        # Neighbours around the insertion point (clamped to the valid range);
+        # ties go to the earlier timestamp.
+        before = max(pos - 1, 0)
+        after = min(pos, len(ts) - 1)
+        i = before if time - ts[before] <= ts[after] - time else after
 
-        t_after = series.iloc[pos]
-        t_before = series.iloc[pos - 1]
+        return int(ts[i]), float(series.prices[i])
 
-        if time - t_before <= t_after - time:
-            return t_before, series[t_before]
-        else:
-            return t_after, series[t_after]
\ No newline at end of file
+    def get_closest_prices(self, asset: str, times: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Batched `get_closest_price`: for each timestamp in `times`, retrieve the closest stored
+        (timestamp, price), returned as two arrays aligned with `times`.
+        Returns None if no data is available.
+        """
+        series = self._series(asset)
+        if not series:
+            return None
+
+        ts = series.timestamps
+        times = np.asarray(times)
+        pos = np.searchsorted(ts, times, side="left")
+
+        # Neighbours around the insertion points (clamped to the valid range);
+        # ties go to the earlier timestamp.
+        before = np.clip(pos - 1, 0, len(ts) - 1)
+        after = np.clip(pos, 0, len(ts) - 1)
+        idx = np.where(times - ts[before] <= ts[after] - times, before, after)
+
+        return ts[idx], series.prices[idx]
@@ -139,39 +139,35 @@ class TrackerEvaluator:
 
                 preds = quar_predictions[step]
 
-                # Get timestamp of the first prediction step
-                ts_rolling = quar_ts - step * (len(preds) - 1)
+                # Timestamps of each prediction step (the first one is quar_ts - step * (len(preds) - 1))
+                ts_rolling = quar_ts - step * np.arange(len(preds) - 1, -1, -1)
 
                 scores_step = []
 
-                # Evaluate each forecasted increment for this step
-                for i in range(len(preds)):
+                # Closest observed prices at the end and at the start of each forecasted increment
+                current_price_data  = self.tracker.prices.get_closest_prices(asset, ts_rolling)
+                previous_price_data = self.tracker.prices.get_closest_prices(asset, ts_rolling - step)
 
-                    current_price_data  = self.tracker.prices.get_closest_price(asset, ts_rolling)
-                    previous_price_data = self.tracker.prices.get_closest_price(asset, ts_rolling - step)
+                if current_price_data is None or previous_price_data is None:
+                    continue
 
-                    ts_rolling += step
+                ts_current, price_current = (a.tolist() for a in current_price_data)
+                ts_prev, price_prev = (a.tolist() for a in previous_price_data)
 
-                    if not current_price_data or not previous_price_data:
-                        continue
+                t_min, t_max = crps_bounds(asset, step)
 
-                    ts_current, price_current = current_price_data
-                    ts_prev, price_prev = previous_price_data
+                # Evaluate each forecasted increment for this step
+                for i in range(len(preds)):
 
-                    if ts_current != ts_prev:
+                    if ts_current[i] != ts_prev[i]:
                         # Observed price increment over this step
-                        delta = (price_current - price_prev)
-
-                        # Step-dependent scaling coefficient for CRPS bounds
-                        # K adjusts the CRPS integration range to the time resolution of the forecast
-                        # For the base step (and finer), no scaling is applied
-                        K = np.sqrt(step / CRPS_BOUNDS["base_step"]) if step > CRPS_BOUNDS["base_step"] else 1
+                        delta = (price_current[i] - price_prev[i])
 
                         crps_value = crps_integral(
                             density_dict=preds[i],
                             x=delta,
-                            t_min=-K * CRPS_BOUNDS["t"][asset],
-                            t_max=K * CRPS_BOUNDS["t"][asset],
+                            t_min=t_min,
+                            t_max=t_max,
                             num_points=CRPS_BOUNDS["num_points"]
                         )
                         scores_step.append(crps_value)
@@ -287,6 +283,71 @@ class TrackerEvaluator:
         return directory
 
 
+def crps_bounds(asset: Asset, step: int) -> tuple[float, float]:
+    """
+    CRPS integration range [t_min, t_max] for a `step`-second forecast of `asset`.
+
+    The base half-width `CRPS_BOUNDS["t"][asset]` is expanded by
+    sqrt(step / base_step) for steps larger than `base_step`.
+    """
+    # Step-dependent scaling coefficient for CRPS bounds
+    # K adjusts the CRPS integration range to the time resolution of the forecast
+    # For the base step (and finer), no scaling is applied
+    K = np.sqrt(step / CRPS_BOUNDS["base_step"]) if step > CRPS_BOUNDS["base_step"] else 1
+    half_width = K * CRPS_BOUNDS["t"][asset]
+    return -half_width, half_width
+
+
+def crps_adaptive_bounds(asset: Asset, step: int, sigma: float) -> tuple[float, float]:
+    """
+    Opt-in, narrower CRPS integration range for fast local evaluation: ±6·sigma·sqrt(step / base_step),
+    clamped to `crps_bounds(asset, step)`.
+
+    `sigma` is the standard deviation of the `base_step` returns. The ±6σ range keeps virtually
+    all of the predictive mass, so the `num_points` grid is spent on a smaller domain. Realized
+    values outside of it are not fully integrated: this is NOT used for official scoring,
+    which always integrates over `crps_bounds`.
+    """
+    _, max_half_width = crps_bounds(asset, step)
+    half_width = min(max_half_width, 6 * sigma * np.sqrt(step / CRPS_BOUNDS["base_step"]))
+    return -half_width, half_width
+
+
+def _norm_mixture_params(density_dict) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """
+    Extract `(weights, locs, scales)` arrays from a builtin "norm" density or a
+    (non-nested) mixture of builtin "norm" densities, following `density_pdf`
+    conventions (absolute weights, normalized by their sum).
+
+    Returns None for any other density, or for specifications `density_pdf`
+    rejects or special-cases (non-positive scale, zero total weight), so that
+    they go through `density_pdf` itself.
+    """
+    if density_dict.get("type") == "mixture":
+        components = [(comp["density"], abs(comp["weight"])) for comp in density_dict["components"]]
+    else:
+        components = [(density_dict, 1.0)]
+
+    params = []
+    for density, weight in components:
+        if density.get("type") != "builtin" or density.get("name") != "norm":
+            return None
+        params.append((weight, density["params"]["loc"], density["params"]["scale"]))
+
+    weights, locs, scales = np.array(params, dtype=float).reshape(-1, 3).T
+    if np.any(scales <= 0) or weights.sum() == 0:
+        return None
+
+    return weights / weights.sum(), locs, scales
+
+
+def _norm_mixture_pdf(ts: np.ndarray, weights: np.ndarray, locs: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Gaussian mixture PDF evaluated on all points of `ts` (components along the second axis)."""
+    z = (ts[:, None] - locs) / scales
+    pdfs = np.exp(-0.5 * z * z) / (scales * np.sqrt(2.0 * np.pi))
+    return pdfs @ weights
+
+
 # NumPy 2.0 removed np.trapz → replaced by np.trapezoid
 if hasattr(np, "trapezoid"):
     trapezoid = np.trapezoid
@@ -305,8 +366,13 @@ def crps_integral(density_dict, x, t_min=-4000, t_max=4000, num_points=256):
     ts = np.linspace(t_min, t_max, num_points)
     dt = ts[1] - ts[0]
 
-    # Vectorized PDF computation
-    pdfs = np.array([density_pdf(density_dict, t) for t in ts], dtype=float)
+    norm_params = _norm_mixture_params(density_dict)
+    if norm_params is not None:
+        # Gaussian (mixture): evaluate the whole grid at once
+        pdfs = _norm_mixture_pdf(ts, *norm_params)
+    else:
+        # Generic density: one density_pdf call per grid point
+        pdfs = np.array([density_pdf(density_dict, t) for t in ts], dtype=float)
 
     # Build CDF by cumulative integration
     cdfs = np.cumsum(pdfs) * dt
@@ -1,25 +1,45 @@
 from math import log10, floor
 from crunch_synth.constants import MAX_DISTRIBUTION_COMPONENTS
 
+# Maximum nesting depth of mixtures (bounds the walk on self-referencing mixtures)
+_MAX_MIXTURE_DEPTH = 64
 
-def count_distribution_components(dist: dict) -> int:
+
+def count_distribution_components(dist: dict, limit: int | None = None) -> int:
     """
-    Recursively count the number of leaf components in a predictive distribution.
+    Count the number of leaf components in a predictive distribution.
 
     - A non-mixture distribution counts as 1 component.
     - A mixture distribution counts as the sum of its leaf components.
-    - Nested mixtures are fully expanded.
+    - Nested mixtures are fully expanded (iterative depth-first walk).
 
-    """
-    if dist.get("type") != "mixture":
-        return 1
+    If `limit` is given, counting stops as soon as the total exceeds it
+    and the partial count (`limit + 1`) is returned.
 
-    components = dist.get("components", [])
+    Raises
+    ------
+    ValueError
+        If mixtures are nested more than `_MAX_MIXTURE_DEPTH` levels deep
+        (e.g. a mixture containing itself).
+    """
+    stack = [(dist, 0)]
     total = 0
 
-    for comp in components:
-        density = comp.get("density", {})
-        total += count_distribution_components(density)
+    while stack:
+        d, depth = stack.pop()
+        if d.get("type") != "mixture":
+            total += 1
+            if limit is not None and total > limit:
+                break
+            continue
+
+        if depth >= _MAX_MIXTURE_DEPTH:
+            raise ValueError(
+                f"Distribution mixtures are nested more than {_MAX_MIXTURE_DEPTH} levels deep "
+                f"(is a mixture referencing itself?)."
+            )
+        for comp in d.get("components", []):
+            stack.append((comp.get("density", {}), depth + 1))
 
     return total
 
@@ -42,15 +62,16 @@ def validate_distribution(dist: dict):
     Raises
     ------
     ValueError
-        If the distribution violates the component limit.
+        If the distribution violates the component limit
+        (or its mixtures are nested too deep).
     """
-    n_components = count_distribution_components(dist)
+    n_components = count_distribution_components(dist, limit=MAX_DISTRIBUTION_COMPONENTS)
 
     if n_components > MAX_DISTRIBUTION_COMPONENTS:
+        # Counting stopped at the limit: the actual total is not known
         raise ValueError(
-            f"Distribution contains {n_components} total components "
-            f"(including nested mixtures), but the maximum allowed is "
-            f"{MAX_DISTRIBUTION_COMPONENTS}."
+            f"Distribution contains more than {MAX_DISTRIBUTION_COMPONENTS} total components "
+            f"(including nested mixtures), which is the maximum allowed."
         )
 
 
@@ -65,7 +65,7 @@ def plot_quarantine(asset, quarantine_entry, step: int, prices: PriceStore, mode
     scales_df["time"] = pd.to_datetime(scales_df["ts"], unit="s", utc=True)
 
     # Attach the historical price for each timestamp
-    scales_df["price"] = [prices.get_closest_price(asset, ts)[1] for ts in scales_df["ts"]]
+    scales_df["price"] = prices.get_closest_prices(asset, scales_df["ts"].to_numpy())[1]
     scales_df["return"] = scales_df["price"].diff().fillna(0.0)
     # print(scales_df)
 
@@ -75,13 +75,9 @@ def plot_quarantine(asset, quarantine_entry, step: int, prices: PriceStore, mode
     hist_ts = []
     hist_price = []
 
-    t = forecast_origin_ts - lookback_seconds
-    while t < forecast_origin_ts:
-        p = prices.get_closest_price(asset, t)
-        if p:
-            hist_ts.append(p[0])
-            hist_price.append(p[1])
-        t += step
+    hist_data = prices.get_closest_prices(asset, np.arange(forecast_origin_ts - lookback_seconds, forecast_origin_ts, step))
+    if hist_data is not None:
+        hist_ts, hist_price = (a.tolist() for a in hist_data)
 
     history_df = pd.DataFrame({
         "ts": hist_ts + [scales_df["ts"].iloc[0]],
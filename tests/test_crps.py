@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from densitypdf import density_pdf
+
+from crunch_synth.constants import CRPS_BOUNDS
+from crunch_synth.tracker_evaluator import (
+    crps_adaptive_bounds, crps_bounds, crps_integral, _norm_mixture_params, _norm_mixture_pdf
+)
+
+
+def _norm(loc, scale):
+    return {"type": "builtin", "name": "norm", "params": {"loc": loc, "scale": scale}}
+
+
+@pytest.mark.parametrize("density", [
+    _norm(0.5, 2.0),
+    {"type": "mixture", "components": [{"density": _norm(0.0, 1.0), "weight": 1}]},
+    {"type": "mixture", "components": [
+        {"density": _norm(-1.0, 0.5), "weight": 0.3},
+        {"density": _norm(2.0, 3.0), "weight": -0.7},  # density_pdf uses absolute weights
+    ]},
+])
+def test_norm_mixture_pdf_matches_density_pdf(density):
+    ts = np.linspace(-20, 20, 256)
+    expected = [density_pdf(density, t) for t in ts]
+
+    assert _norm_mixture_pdf(ts, *_norm_mixture_params(density)) == pytest.approx(expected, rel=1e-12)
+
+
+def test_non_norm_densities_use_density_pdf():
+    nested = {"type": "mixture", "components": [
+        {"density": {"type": "mixture", "components": [{"density": _norm(0.0, 1.0), "weight": 1}]}, "weight": 1},
+    ]}
+    assert _norm_mixture_params(nested) is None
+    assert _norm_mixture_params({"type": "scipy", "name": "norm", "params": {"loc": 0, "scale": 1}}) is None
+
+    # Same score as the flat equivalent, computed through density_pdf
+    flat = nested["components"][0]["density"]
+    assert crps_integral(nested, 0.3, -10, 10) == pytest.approx(crps_integral(flat, 0.3, -10, 10), rel=1e-12)
+
+
+def test_crps_adaptive_bounds():
+    base_step = CRPS_BOUNDS["base_step"]
+    btc = CRPS_BOUNDS["t"]["BTC"]
+
+    # K scaling of the official bounds, applied above the base step only
+    assert crps_bounds("BTC", base_step // 5) == (-btc, btc)
+    assert crps_bounds("BTC", 4 * base_step) == pytest.approx((-2 * btc, 2 * btc))
+
+    # Small sigma: ±6·sigma·sqrt(step / base_step)
+    assert crps_adaptive_bounds("BTC", base_step, 10.0) == pytest.approx((-60.0, 60.0))
+    assert crps_adaptive_bounds("BTC", 4 * base_step, 10.0) == pytest.approx((-120.0, 120.0))
+
+    # Large sigma: clamped to the (K-scaled) official bounds
+    assert crps_adaptive_bounds("BTC", base_step, btc) == crps_bounds("BTC", base_step)
+    assert crps_adaptive_bounds("BTC", 4 * base_step, btc) == pytest.approx(crps_bounds("BTC", 4 * base_step))
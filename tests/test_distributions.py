@@ -0,0 +1,52 @@
+import pytest
+
+from crunch_synth.constants import MAX_DISTRIBUTION_COMPONENTS
+from crunch_synth.utils.distributions import count_distribution_components, validate_distribution
+
+
+def _norm():
+    return {"type": "builtin", "name": "norm", "params": {"loc": 0.0, "scale": 1.0}}
+
+
+def _mixture(*densities):
+    return {"type": "mixture", "components": [{"density": d, "weight": 1} for d in densities]}
+
+
+def test_count_distribution_components_nested():
+    dist = _mixture(_norm(), _mixture(_norm(), _mixture(_norm(), _norm())), _norm())
+    assert count_distribution_components(_norm()) == 1
+    assert count_distribution_components(dist) == 5
+
+
+def test_count_distribution_components_stops_at_limit():
+    dist = _mixture(_norm(), _mixture(_norm(), _mixture(_norm(), _norm())), _norm())
+    for k in range(1, 5):
+        assert count_distribution_components(dist, limit=k) == k + 1
+    assert count_distribution_components(dist, limit=5) == 5
+
+
+def test_validate_distribution_over_limit():
+    leaves = [_norm() for _ in range(MAX_DISTRIBUTION_COMPONENTS + 1)]
+    dist = _mixture(leaves[0], _mixture(*leaves[1:]))
+
+    with pytest.raises(ValueError, match=f"more than {MAX_DISTRIBUTION_COMPONENTS} total components"):
+        validate_distribution(dist)
+
+    # At the limit: accepted
+    validate_distribution(_mixture(leaves[0], _mixture(*leaves[2:])))
+
+
+def test_cyclic_mixture_does_not_hang():
+    # Self-referencing mixture with a leaf: the component limit is hit first
+    with_leaf = _mixture(_norm())
+    with_leaf["components"].append({"density": with_leaf, "weight": 1})
+    with pytest.raises(ValueError, match="more than"):
+        validate_distribution(with_leaf)
+
+    # Without any leaf, only the nesting depth bounds the walk
+    no_leaf = _mixture()
+    no_leaf["components"].append({"density": no_leaf, "weight": 1})
+    with pytest.raises(ValueError, match="nested more than"):
+        validate_distribution(no_leaf)
+    with pytest.raises(ValueError, match="nested more than"):
+        count_distribution_components(with_leaf)
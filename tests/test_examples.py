@@ -1,9 +1,13 @@
 # test.py
 from datetime import datetime, timezone, timedelta
 import numpy as np
+import pytest
 
 from crunch_synth.tracker import PriceData
 from crunch_synth.examples.exampletracker import GaussianStepTracker  # replace with actual import path
+from crunch_synth.examples import exampletracker
+from crunch_synth.examples.exampletracker import _return_stats_loop, _return_stats_numpy
+from crunch_synth.examples.subtracker_example import _training_samples
 
 
 # -------------------------------
@@ -64,6 +68,79 @@ def test_gaussian_step_tracker():
     print("Sanity check passed: GaussianStepTracker predictions valid.")
 
 
+def test_gaussian_step_tracker_stats_follow_backfilled_prices():
+    start_ts = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp())
+    synthetic_prices = generate_synthetic_prices(start_ts, 3000, 60)
+
+    tracker = GaussianStepTracker()
+    tracker.tick({"FAKE": synthetic_prices})
+    before = tracker.predict("FAKE", 3600, 300)[0]["components"][0]["density"]["params"]
+
+    # Rewrite every bar except the last one: the last tick is unchanged
+    rewritten = [(ts, 2 * price) for ts, price in synthetic_prices[:-1]] + synthetic_prices[-1:]
+    tracker.tick({"FAKE": rewritten})
+    after = tracker.predict("FAKE", 3600, 300)[0]["components"][0]["density"]["params"]
+
+    fresh = GaussianStepTracker()
+    fresh.tick({"FAKE": rewritten})
+    expected = fresh.predict("FAKE", 3600, 300)[0]["components"][0]["density"]["params"]
+
+    assert after["scale"] != before["scale"]
+    assert after == expected
+
+
+def test_gaussian_step_tracker_shared_density_is_not_rewritten():
+    start_ts = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp())
+    tracker = GaussianStepTracker()
+    tracker.tick({"FAKE": generate_synthetic_prices(start_ts, 3000, 60)})
+
+    predictions = tracker.predict_all("FAKE", 3600, [300])[300]
+    # One density dict shared by every step, already rounded: predict_all's rounding left it as built
+    density = predictions[0]["components"][0]["density"]
+    assert all(p["components"][0]["density"] is density for p in predictions)
+    assert density["params"] == tracker.predict("FAKE", 3600, 300)[0]["components"][0]["density"]["params"]
+
+
+@pytest.mark.parametrize("return_stats", [_return_stats_loop, _return_stats_numpy, exampletracker._return_stats])
+def test_return_stats(return_stats):
+    # returns: [1, -1.5, 2.5, 0] => mean 0.5 (= (102 - 100) / 4), centered squares sum 8.5
+    prices = np.array([100.0, 101.0, 99.5, 102.0, 102.0])
+    returns = np.diff(prices)
+
+    mu, sigma = return_stats(prices)
+    assert mu == pytest.approx(0.5, rel=1e-12)
+    assert sigma == pytest.approx(np.sqrt(8.5 / 4), rel=1e-12)
+    assert (mu, sigma) == pytest.approx((returns.mean(), returns.std()), rel=1e-12)
+
+    # the returns are centered in place, not the input prices
+    assert prices.tolist() == [100.0, 101.0, 99.5, 102.0, 102.0]
+
+
+def _training_samples_loop(returns, window, future):
+    X = []
+    y = []
+    for i in range(window, len(returns) - future):
+        past = returns[i - window:i]
+        X.append([np.mean(past), np.std(past)])
+        future_returns = returns[i:i + future]
+        y.append(np.log(np.std(future_returns) + 1e-8))
+    return np.array(X), np.array(y)
+
+
+def test_training_samples_match_loop():
+    returns = np.random.default_rng(0).normal(0, 1, 60)
+
+    X, y = _training_samples(returns, window=12, future=5)
+    expected_X, expected_y = _training_samples_loop(returns, window=12, future=5)
+
+    assert X.shape == (60 - 12 - 5, 2)
+    np.testing.assert_allclose(X, expected_X, rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(y, expected_y, rtol=1e-12)
+
+    with pytest.raises(ValueError, match="Not enough data"):
+        _training_samples(returns[:17], window=12, future=5)
+
+
 # -------------------------------
 # Run test
 # -------------------------------
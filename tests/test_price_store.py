@@ -1,6 +1,7 @@
 # tests/test_price_store.py
 
 import pytest
+import numpy as np
 from datetime import datetime, timedelta, timezone
 from bisect import bisect_left
 
@@ -174,8 +175,139 @@ def test_window_days_trimming():
     # (si ton cutoff est ts_last - 5days, inclusif)
     assert len(store.data["BTC"]) == 6
     last_ts, _ = store.get_last_price("BTC")
-    oldest_kept = min(store.data["BTC"].keys())
+    oldest_kept = int(store.data["BTC"].timestamps[0])
     assert oldest_kept >= last_ts - 5*86400
+
+
+def test_get_prices_resolution_with_gaps():
+    store = PriceStore()
+    t = int(datetime.now(timezone.utc).timestamp())
+    offsets = [0, 60, 90, 200, 210, 400, 460, 520]
+    store.add_prices("BTC", [(t + o, float(o)) for o in offsets])
+
+    # next point at least 120s after the previously selected one
+    prices = store.get_prices("BTC", resolution=120)
+    assert [x[0] - t for x in prices] == [0, 200, 400, 520]
+
+
+def test_buffer_growth_keeps_order():
+    store = PriceStore()
+    ts = int(datetime.now(timezone.utc).timestamp())
+    series = generate_price_series(ts, 5000, 60)
+    for i in range(0, len(series), 700):
+        store.add_prices("BTC", series[i:i + 700])
+
+    assert len(store.data["BTC"]) == len(series)
+    assert store.get_prices("BTC") == series
+
+
+def test_unknown_asset_lookup_does_not_create_entry():
+    store = PriceStore()
+    assert store.get_prices("ETH") == []
+    assert store.get_last_price("ETH") is None
+    assert store.get_closest_price("ETH", 0) is None
+    assert "ETH" not in store.data
+
+    t = int(datetime.now(timezone.utc).timestamp())
+    store.add_prices("ETH", [(t, 1.0)])
+    assert store.get_last_price("ETH") == (t, 1.0)
+
+
+def test_add_prices_accepts_str_subclass_symbols():
+    store = PriceStore()
+    t = int(datetime.now(timezone.utc).timestamp())
+    store.add_prices(np.str_("BTC"), [(t, 1.0)])
+    assert store.get_last_price("BTC") == (t, 1.0)
+
+
+def test_add_prices_arrays_matches_add_prices():
+    ts = int(datetime.now(timezone.utc).timestamp())
+    series = generate_price_series(ts, 20, 60)
+
+    store = PriceStore()
+    store.add_prices("BTC", series)
+
+    store_arrays = PriceStore()
+    t, p = zip(*series)
+    store_arrays.add_prices_arrays("BTC", np.array(t), np.array(p))
+
+    assert store_arrays.get_prices("BTC") == store.get_prices("BTC")
+
+
+def test_get_prices_cache_invalidated_on_update():
+    store = PriceStore()
+    ts = int(datetime.now(timezone.utc).timestamp())
+    series = generate_price_series(ts, 10, 60)
+    store.add_prices("BTC", series)
+
+    first = store.get_prices("BTC", resolution=120)
+    first.clear()  # callers own the returned list
+    assert len(store.get_prices("BTC", resolution=120)) == 5
+
+    # overwrite an existing timestamp: same last timestamp, new content
+    store.add_prices("BTC", [(series[0][0], 999.0)])
+    assert store.get_prices("BTC", resolution=120)[0] == (series[0][0], 999.0)
+
+
+def test_get_closest_prices_matches_get_closest_price():
+    store = PriceStore()
+    ts = int(datetime.now(timezone.utc).timestamp())
+    series = generate_price_series(ts, 10, 60)
+    store.add_prices("BTC", series)
+
+    times = np.array([ts - 1000, ts, ts + 30, ts + 31, ts + 89, ts + 540, ts + 5000])
+    closest_ts, closest_prices = store.get_closest_prices("BTC", times)
+    assert list(zip(closest_ts.tolist(), closest_prices.tolist())) == [
+        store.get_closest_price("BTC", int(t)) for t in times
+    ]
+    assert store.get_closest_prices("ETH", times) is None
+
+
+def test_sliding_window_streaming_ticks():
+    store = PriceStore(window_days=1)
+    now = int(datetime.now(timezone.utc).timestamp())
+
+    # 3 days of 1-minute ticks, one by one: the window slides and the buffer compacts
+    series = generate_price_series(now - 3*86400, 3*1440, 60, start_price=1.0)
+    for t, p in series:
+        store.add_prices("BTC", [(t, p)])
+
+    # last day inclusive => 1441 points
+    assert store.get_prices("BTC") == series[-1441:]
+
+
+def resample_reference(series, resolution):
+    """Keep the first point, then each first point at least `resolution` seconds after the previously kept one."""
+    result = []
+    for t, p in series:
+        if not result or t >= result[-1][0] + resolution:
+            result.append((t, p))
+    return result
+
+
+@pytest.mark.parametrize("resolution", [60, 90, 120, 300, 301])
+def test_get_prices_resolution_with_missing_bars(resolution):
+    store = PriceStore()
+    ts = int(datetime.now(timezone.utc).timestamp())
+    series = generate_price_series(ts, 2000, 60)
+    # a few missing minute bars (one of them right after the first point) and a longer gap
+    series = [e for i, e in enumerate(series) if i not in (1, 500, 1001, 1002) and not 1500 <= i < 1537]
+    store.add_prices("BTC", series)
+
+    assert store.get_prices("BTC", resolution=resolution) == resample_reference(series, resolution)
+
+
+@pytest.mark.parametrize("resolution", [60, 90, 300])
+def test_get_prices_resolution_irregular_ticks(resolution):
+    store = PriceStore()
+    ts = int(datetime.now(timezone.utc).timestamp())
+    offsets = np.cumsum(np.random.default_rng(0).integers(1, 120, 500))
+    series = [(ts + int(o), float(i)) for i, o in enumerate(offsets)]
+    store.add_prices("BTC", series)
+
+    assert store.get_prices("BTC", resolution=resolution) == resample_reference(series, resolution)
+
+
 # ---------------------------
 # Run pytest directly
 # ---------------------------